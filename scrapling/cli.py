@@ -2,12 +2,11 @@ from pathlib import Path
 from subprocess import check_output
 from sys import executable as python_executable
 
-from curl_cffi.requests import impersonate
+from scrapling.core._types import List, Optional, Dict, Tuple, Any, Callable, TYPE_CHECKING
 
-from scrapling.core.utils import log
-from scrapling.engines.toolbelt.custom import Response
-from scrapling.core.utils._shell import _CookieParser, _ParseHeaders
-from scrapling.core._types import List, Optional, Dict, Tuple, Any, Callable
+if TYPE_CHECKING:
+    # Only needed for annotations, importing it pulls in curl_cffi, playwright and the parser on every CLI call
+    from scrapling.engines.toolbelt.custom import Response
 
 from orjson import loads as json_loads, JSONDecodeError
 
@@ -22,6 +21,15 @@ __OUTPUT_FILE_HELP__ = "The output file path can be an HTML file, a Markdown fil
 __PACKAGE_DIR__ = Path(__file__).parent
 
 
+def __getattr__(name: str) -> Any:
+    # `log` is still importable from here, but loaded on first access so the CLI doesn't pay for lxml up front
+    if name == "log":
+        from scrapling.core.utils import log
+
+        return log
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def __Execute(cmd: List[str], help_line: str) -> None:  # pragma: no cover
     print(f"Installing {help_line}...")
     _ = check_output(cmd, shell=False)  # nosec B603
@@ -40,13 +48,14 @@ def __ParseJSONData(json_string: Optional[str] = None) -> Optional[Dict[str, Any
 
 
 def __Request_and_Save(
-    fetcher_func: Callable[..., Response],
+    fetcher_func: Callable[..., "Response"],
     url: str,
     output_file: str,
     css_selector: Optional[str] = None,
     **kwargs,
 ) -> None:
     """Make a request using the specified fetcher function and save the result"""
+    from scrapling.core.utils import log
     from scrapling.core.shell import Convertor
 
     # Handle relative paths - convert to an absolute path based on the current working directory
@@ -63,6 +72,8 @@ def __ParseExtractArguments(
     headers: List[str], cookies: str, params: str, json: Optional[str] = None
 ) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str], Optional[Dict[str, str]]]:
     """Parse arguments for extract command"""
+    from scrapling.core.utils._shell import _CookieParser, _ParseHeaders
+
     parsed_headers, parsed_cookies = _ParseHeaders(headers)
     if cookies:
         for key, value in _CookieParser(cookies):
@@ -668,6 +679,8 @@ def fetch(
     :param extra_headers: Extra headers to add to the request.
     """
 
+    from scrapling.core.utils._shell import _ParseHeaders
+
     # Parse parameters
     parsed_headers, _ = _ParseHeaders(extra_headers, False)
 
@@ -814,6 +827,8 @@ def stealthy_fetch(
     :param extra_headers: Extra headers to add to the request.
     """
 
+    from scrapling.core.utils._shell import _ParseHeaders
+
     # Parse parameters
     parsed_headers, _ = _ParseHeaders(extra_headers, False)
 
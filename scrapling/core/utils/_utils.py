@@ -59,7 +59,7 @@ class _StorageTools:
     def __clean_attributes(element: html.HtmlElement, forbidden: tuple = ()) -> Dict:
         if not element.attrib:
             return {}
-        return {k: v.strip() for k, v in element.attrib.items() if v and v.strip() and k not in forbidden}
+        return {k: stripped for k, v in element.attrib.items() if k not in forbidden and v and (stripped := v.strip())}
 
     @classmethod
     def element_to_dict(cls, element: html.HtmlElement) -> Dict:
@@ -1,4 +1,6 @@
 from time import time
+from functools import lru_cache
+from re import compile as re_compile
 from asyncio import sleep as asyncio_sleep, Lock
 
 from camoufox import DefaultAddons
@@ -28,7 +30,14 @@ from ._validators import validate, PlaywrightConfig, CamoufoxConfig
 from ._config_tools import _compiled_stealth_scripts, _launch_kwargs, _context_kwargs
 from scrapling.engines.toolbelt.navigation import intercept_route, async_intercept_route
 
-__ff_version_str__ = camoufox_version().split(".", 1)[0]
+# All the challenge types in one pattern, so the page content is scanned once
+__CF_CTYPE_PATTERN__ = re_compile(r"cType: '(non-interactive|managed|interactive)'")
+
+
+@lru_cache(1)
+def _ff_version() -> str:
+    """The major version of the installed Camoufox browser, looked up on first use so importing this module doesn't need it"""
+    return camoufox_version().split(".", 1)[0]
 
 
 class SyncSession:
@@ -65,6 +74,14 @@ class SyncSession:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    def _close_error_pages(self):
+        """Free the slots of pages left behind by failed requests, otherwise the pool fills up with them"""
+        for error_page in self.page_pool.cleanup_error_pages():
+            try:
+                error_page.page.close()
+            except PlaywrightError:
+                pass
+
     def _get_page(
         self,
         timeout: int | float,
@@ -75,6 +92,8 @@ class SyncSession:
 
         # No need to check if a page is available or not in sync code because the code blocked before reaching here till the page closed, ofc.
         assert self.context is not None, "Browser context not initialized"
+        self._close_error_pages()
+
         page = self.context.new_page()
         page.set_default_navigation_timeout(timeout)
         page.set_default_timeout(timeout)
@@ -170,6 +189,14 @@ class AsyncSession:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
+    async def _close_error_pages(self):
+        """Free the slots of pages left behind by failed requests, otherwise the pool fills up with them"""
+        for error_page in self.page_pool.cleanup_error_pages():
+            try:
+                await error_page.page.close()
+            except PlaywrightError:
+                pass
+
     async def _get_page(
         self,
         timeout: int | float,
@@ -181,11 +208,15 @@ class AsyncSession:
             assert self.context is not None, "Browser context not initialized"
 
         async with self._lock:
+            await self._close_error_pages()
+
             # If we're at max capacity after cleanup, wait for busy pages to finish
             if self.page_pool.pages_count >= self.max_pages:
                 start_time = time()
                 while time() - start_time < self._max_wait_for_page:
                     await asyncio_sleep(0.05)
+                    # Requests that fail while we wait leave their pages in the pool, so they have to be freed here too
+                    await self._close_error_pages()
                     if self.page_pool.pages_count < self.max_pages:
                         break
                 else:
@@ -377,7 +408,7 @@ class StealthySessionMixin:
                 "block_images": self.block_images,  # Careful! it makes some websites don't finish loading at all like stackoverflow even in headful mode.
                 "os": None if self.os_randomize else get_os_name(),
                 "user_data_dir": self.user_data_dir,
-                "ff_version": __ff_version_str__,
+                "ff_version": _ff_version(),
                 "firefox_user_prefs": {
                     # This is what enabling `enable_cache` does internally, so we do it from here instead
                     "browser.sessionhistory.max_entries": 10,
@@ -409,16 +440,14 @@ class StealthySessionMixin:
             str: A string representing the detected Cloudflare challenge type, if
                 found. Returns None if no challenge matches.
         """
-        challenge_types = (
-            "non-interactive",
-            "managed",
-            "interactive",
-        )
-        for ctype in challenge_types:
-            if f"cType: '{ctype}'" in page_content:
-                return ctype
+        if match := __CF_CTYPE_PATTERN__.search(page_content):
+            return match.group(1)
 
         # Check if turnstile captcha is embedded inside the page (Usually inside a closed Shadow iframe)
+        # A plain substring check first, so pages without the turnstile script never pay for a full HTML parse
+        if "challenges.cloudflare.com/turnstile/v" not in page_content:
+            return None
+
         selector = Selector(content=page_content)
         if selector.css('script[src*="challenges.cloudflare.com/turnstile/v"]'):
             return "embedded"
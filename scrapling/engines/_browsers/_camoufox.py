@@ -1,4 +1,5 @@
-from random import randint
+from pathlib import Path
+from asyncio import gather, to_thread
 from re import compile as re_compile
 
 from playwright.sync_api import (
@@ -36,6 +37,12 @@ from scrapling.engines.toolbelt.convertor import (
 from scrapling.engines.toolbelt.fingerprints import generate_convincing_referer
 
 __CF_PATTERN__ = re_compile("challenges.cloudflare.com/cdn-cgi/challenge-platform/.*")
+# Resolves once the "Verifying you are human." spinner text is gone from the page
+__CF_VERIFIED_JS__ = "() => !document.documentElement.textContent.includes('Verifying you are human.')"
+# Resolves once the page has moved past Cloudflare's "Just a moment..." wait page
+__CF_WAIT_PAGE_GONE_JS__ = "() => document.title !== 'Just a moment...'"
+# How long (ms) the solvers wait for the challenge box to show up before giving up on it
+__CF_BOX_WAIT_TIMEOUT__ = 5000
 _UNSET: Any = object()
 
 
@@ -114,7 +121,7 @@ class StealthySession(StealthySessionMixin, SyncSession):
         :param block_images: Prevent the loading of images through Firefox preferences.
             This can help save your proxy usage but be careful with this option as it makes some websites never finish loading.
         :param disable_resources: Drop requests of unnecessary resources for a speed boost. It depends, but it made requests ~25% faster in my tests for some websites.
-            Requests dropped are of type `font`, `image`, `media`, `beacon`, `object`, `imageset`, `texttrack`, `websocket`, `csp_report`, and `stylesheet`.
+            Requests dropped are of type `font`, `image`, `media`, `beacon`, `object`, `imageset`, `texttrack`, `websocket`, `csp_report`, `manifest`, and `stylesheet`.
             This can help save your proxy usage but be careful with this option as it makes some websites never finish loading.
         :param block_webrtc: Blocks WebRTC entirely.
         :param cookies: Set cookies for the next request.
@@ -239,10 +246,9 @@ class StealthySession(StealthySessionMixin, SyncSession):
         else:
             log.info(f'The turnstile version discovered is "{challenge_type}"')
             if challenge_type == "non-interactive":
-                while "<title>Just a moment...</title>" in (self._get_page_content(page)):
-                    log.info("Waiting for Cloudflare wait page to disappear.")
-                    page.wait_for_timeout(1000)
-                    page.wait_for_load_state()
+                log.info("Waiting for Cloudflare wait page to disappear.")
+                page.wait_for_function(__CF_WAIT_PAGE_GONE_JS__, polling=500, timeout=0)
+                page.wait_for_load_state()
                 log.info("Cloudflare turnstile is solved")
                 return
 
@@ -254,15 +260,14 @@ class StealthySession(StealthySessionMixin, SyncSession):
                 # )
                 if challenge_type != "embedded":
                     box_selector = ".main-content p+div>div>div"
-                    while "Verifying you are human." in self._get_page_content(page):
-                        # Waiting for the verify spinner to disappear, checking every 1s if it disappeared
-                        page.wait_for_timeout(500)
+                    # Waiting for the verify spinner to disappear, checked inside the page every 500ms instead of pulling the content
+                    page.wait_for_function(__CF_VERIFIED_JS__, polling=500, timeout=0)
 
                 outer_box = {}
                 iframe = page.frame(url=__CF_PATTERN__)
                 if iframe is not None:
-                    iframe.wait_for_load_state(state="domcontentloaded")
-                    iframe.wait_for_load_state("networkidle")
+                    # The turnstile iframe keeps polling in the background, so wait for it to load rather than for network idle
+                    iframe.wait_for_load_state(state="load")
 
                 # Debug: Log iframe and page information
                 log.info(f"Current page URL: {page.url}")
@@ -281,43 +286,43 @@ class StealthySession(StealthySessionMixin, SyncSession):
                         page.wait_for_timeout(500)
 
                 # Calculate the Captcha coordinates for any viewport
-                # Debug: Log all matching elements
-                all_elements = page.locator(box_selector).all()
-                log.info(f"Found {len(all_elements)} elements matching selector: {box_selector}")
-                for i, elem in enumerate(all_elements):
-                    try:
-                        bbox = elem.bounding_box()
-                        if bbox:
-                            log.info(
-                                f"  Element {i}: x={bbox['x']}, y={bbox['y']}, width={bbox['width']}, height={bbox['height']}"
-                            )
-                        else:
-                            log.info(f"  Element {i}: No bounding box")
-                    except Exception as e:
-                        log.info(f"  Element {i}: Error getting bbox - {e}")
-
-                # Use last element as before, but with more logging
-                locator = page.locator(box_selector).first
-                # Debug: Check if the element exists
-                if locator.count() == 0:
+                # One locator for the box selector, reused for every lookup below
+                box_locator = page.locator(box_selector)
+                if log.getEffectiveLevel() < 20:
+                    # Debug: Log all matching elements, each bounding box is a round trip to the browser so only when debugging
+                    all_elements = box_locator.all()
+                    log.debug(f"Found {len(all_elements)} elements matching selector: {box_selector}")
+                    for i, elem in enumerate(all_elements):
+                        try:
+                            bbox = elem.bounding_box()
+                            if bbox:
+                                log.debug(
+                                    f"  Element {i}: x={bbox['x']}, y={bbox['y']}, width={bbox['width']}, height={bbox['height']}"
+                                )
+                            else:
+                                log.debug(f"  Element {i}: No bounding box")
+                        except Exception as e:
+                            log.debug(f"  Element {i}: Error getting bbox - {e}")
+
+                locator = box_locator.first
+                try:
+                    # Always scroll into view to ensure the element is visible and clickable.
+                    # This auto-waits for the element (briefly), so there's no need to probe for it first
+                    locator.scroll_into_view_if_needed(timeout=__CF_BOX_WAIT_TIMEOUT__)
+                except PlaywrightError:
                     log.error(f"Could not find Cloudflare challenge element with selector: {box_selector}")
-                    # Try to find what elements are actually on the page
-                    page.screenshot(path="cloudflare_debug.png")
-                    # Save page HTML for inspection
-                    with open("cloudflare_debug.html", "w") as f:
-                        f.write(page.content())
-                    log.error(
-                        "Saved debug screenshot and HTML. Please check cloudflare_debug.png and cloudflare_debug.html"
-                    )
-                    return
-
-                outer_box = locator.bounding_box()
-                if outer_box is None:
-                    log.error(f"Element found but bounding box is None for selector: {box_selector}")
+                    if log.getEffectiveLevel() < 20:
+                        # Only dump the page when debugging, the screenshot and HTML are costly and written to the CWD
+                        # Try to find what elements are actually on the page
+                        page.screenshot(path="cloudflare_debug.png")
+                        # Save page HTML for inspection
+                        with open("cloudflare_debug.html", "w") as f:
+                            f.write(page.content())
+                        log.error(
+                            "Saved debug screenshot and HTML. Please check cloudflare_debug.png and cloudflare_debug.html"
+                        )
                     return
 
-                # Always scroll into view to ensure the element is visible and clickable
-                locator.scroll_into_view_if_needed()
                 page.wait_for_timeout(500)
 
                 # Get fresh bounding box after scroll
@@ -351,10 +356,10 @@ class StealthySession(StealthySessionMixin, SyncSession):
                 #     while iframe in page.frames:
                 #         page.wait_for_timeout(100)
                 if challenge_type != "embedded":
-                    page.locator(box_selector).last.wait_for(state="detached")
+                    box_locator.last.wait_for(state="detached")
                     page.locator(".zone-name-title").wait_for(state="hidden")
+                # The load event always comes after `domcontentloaded`, so there's no need to wait for both
                 page.wait_for_load_state(state="load")
-                page.wait_for_load_state(state="domcontentloaded")
 
                 log.info("Cloudflare captcha is solved")
                 return
@@ -384,7 +389,7 @@ class StealthySession(StealthySessionMixin, SyncSession):
         :param page_action: Added for automation. A function that takes the `page` object and does the automation you need.
         :param extra_headers: A dictionary of extra headers to add to the request. _The referer set by the `google_search` argument takes priority over the referer set here if used together._
         :param disable_resources: Drop requests of unnecessary resources for a speed boost. It depends, but it made requests ~25% faster in my tests for some websites.
-            Requests dropped are of type `font`, `image`, `media`, `beacon`, `object`, `imageset`, `texttrack`, `websocket`, `csp_report`, and `stylesheet`.
+            Requests dropped are of type `font`, `image`, `media`, `beacon`, `object`, `imageset`, `texttrack`, `websocket`, `csp_report`, `manifest`, and `stylesheet`.
             This can help save your proxy usage but be careful with this option as it makes some websites never finish loading.
         :param wait_selector: Wait for a specific CSS selector to be in a specific state.
         :param wait_selector_state: The state to wait for the selector given with `wait_selector`. The default state is `attached`.
@@ -437,11 +442,7 @@ class StealthySession(StealthySessionMixin, SyncSession):
             # Navigate to URL and wait for a specified state
             page_info.page.on("response", handle_response)
             first_response = page_info.page.goto(url, referer=referer)
-            if params.load_dom:
-                page_info.page.wait_for_load_state(state="domcontentloaded")
-
-            if params.network_idle:
-                page_info.page.wait_for_load_state("networkidle")
+            self._wait_for_page_stability(page_info.page, params.load_dom, params.network_idle)
 
             if not first_response:
                 raise RuntimeError(f"Failed to get response for {url}")
@@ -449,11 +450,7 @@ class StealthySession(StealthySessionMixin, SyncSession):
             if params.solve_cloudflare:
                 self._solve_cloudflare(page_info.page)
                 # Make sure the page is fully loaded after the turnstile is solved
-                page_info.page.wait_for_load_state(state="load")
-                if params.load_dom:
-                    page_info.page.wait_for_load_state(state="domcontentloaded")
-                if params.network_idle:
-                    page_info.page.wait_for_load_state("networkidle")
+                self._wait_for_page_stability(page_info.page, params.load_dom, params.network_idle)
 
             if params.page_action:
                 try:
@@ -466,11 +463,7 @@ class StealthySession(StealthySessionMixin, SyncSession):
                     waiter: Locator = page_info.page.locator(params.wait_selector)
                     waiter.first.wait_for(state=params.wait_selector_state)
                     # Wait again after waiting for the selector, helpful with protections like Cloudflare
-                    page_info.page.wait_for_load_state(state="load")
-                    if params.load_dom:
-                        page_info.page.wait_for_load_state(state="domcontentloaded")
-                    if params.network_idle:
-                        page_info.page.wait_for_load_state("networkidle")
+                    self._wait_for_page_stability(page_info.page, params.load_dom, params.network_idle)
                 except Exception as e:
                     log.error(f"Error waiting for selector {params.wait_selector}: {e}")
 
@@ -529,7 +522,7 @@ class AsyncStealthySession(StealthySessionMixin, AsyncSession):
         :param block_images: Prevent the loading of images through Firefox preferences.
             This can help save your proxy usage but be careful with this option as it makes some websites never finish loading.
         :param disable_resources: Drop requests of unnecessary resources for a speed boost. It depends, but it made requests ~25% faster in my tests for some websites.
-            Requests dropped are of type `font`, `image`, `media`, `beacon`, `object`, `imageset`, `texttrack`, `websocket`, `csp_report`, and `stylesheet`.
+            Requests dropped are of type `font`, `image`, `media`, `beacon`, `object`, `imageset`, `texttrack`, `websocket`, `csp_report`, `manifest`, and `stylesheet`.
             This can help save your proxy usage but be careful with this option as it makes some websites never finish loading.
         :param block_webrtc: Blocks WebRTC entirely.
         :param cookies: Set cookies for the next request.
@@ -655,10 +648,9 @@ class AsyncStealthySession(StealthySessionMixin, AsyncSession):
         else:
             log.info(f'The turnstile version discovered is "{challenge_type}"')
             if challenge_type == "non-interactive":  # pragma: no cover
-                while "<title>Just a moment...</title>" in (await self._get_page_content(page)):
-                    log.info("Waiting for Cloudflare wait page to disappear.")
-                    await page.wait_for_timeout(1000)
-                    await page.wait_for_load_state()
+                log.info("Waiting for Cloudflare wait page to disappear.")
+                await page.wait_for_function(__CF_WAIT_PAGE_GONE_JS__, polling=500, timeout=0)
+                await page.wait_for_load_state()
                 log.info("Cloudflare turnstile is solved")
                 return
 
@@ -671,46 +663,39 @@ class AsyncStealthySession(StealthySessionMixin, AsyncSession):
                 )
                 if challenge_type != "embedded":
                     box_selector = ".main-content p+div>div>div"
-                    while "Verifying you are human." in (await self._get_page_content(page)):
-                        # Waiting for the verify spinner to disappear, checking every 1s if it disappeared
-                        await page.wait_for_timeout(500)
+                    # Waiting for the verify spinner to disappear, checked inside the page every 500ms instead of pulling the content
+                    await page.wait_for_function(__CF_VERIFIED_JS__, polling=500, timeout=0)
 
-                outer_box = {}
                 iframe = page.frame(url=__CF_PATTERN__)
                 if iframe is not None:
-                    await iframe.wait_for_load_state(state="domcontentloaded")
-                    await iframe.wait_for_load_state("networkidle")
+                    # The turnstile iframe keeps polling in the background, so wait for it to load rather than for network idle
+                    await iframe.wait_for_load_state(state="load")
 
                     if challenge_type != "embedded":
                         while not await (await iframe.frame_element()).is_visible():
                             # Double-checking that the iframe is loaded
                             await page.wait_for_timeout(500)
-                    outer_box: Any = await (await iframe.frame_element()).bounding_box()
-
-                if not iframe or not outer_box:
-                    outer_box: Any = await page.locator(box_selector).last.bounding_box()
 
                 # Calculate the Turnstile coordinates for any viewport
                 # Use first element and validate it's in viewport
-                locator = page.locator(box_selector).first
-                count = await locator.count()
-                if count == 0:
+                box_locator = page.locator(box_selector)
+                locator = box_locator.first
+                try:
+                    # Always scroll into view to ensure the element is visible and clickable.
+                    # This auto-waits for the element (briefly), so there's no need to probe for it with `count()` first
+                    await locator.scroll_into_view_if_needed(timeout=__CF_BOX_WAIT_TIMEOUT__)
+                except PlaywrightError:
                     log.error(f"Could not find Cloudflare challenge element with selector: {box_selector}")
-                    await page.screenshot(path="cloudflare_debug.png")
-                    with open("cloudflare_debug.html", "w") as f:
-                        f.write(await page.content())
-                    log.error(
-                        "Saved debug screenshot and HTML. Please check cloudflare_debug.png and cloudflare_debug.html"
-                    )
+                    if log.getEffectiveLevel() < 20:
+                        # Only dump the page when debugging, the screenshot and HTML are costly and written to the CWD
+                        # Take the screenshot and grab the HTML together, then write the HTML off the event loop
+                        _, html_content = await gather(page.screenshot(path="cloudflare_debug.png"), page.content())
+                        await to_thread(Path("cloudflare_debug.html").write_text, html_content)
+                        log.error(
+                            "Saved debug screenshot and HTML. Please check cloudflare_debug.png and cloudflare_debug.html"
+                        )
                     return
 
-                outer_box = await locator.bounding_box()
-                if outer_box is None:
-                    log.error(f"Element found but bounding box is None for selector: {box_selector}")
-                    return
-
-                # Always scroll into view to ensure the element is visible and clickable
-                await locator.scroll_into_view_if_needed()
                 await page.wait_for_timeout(500)
 
                 # Get fresh bounding box after scroll
@@ -723,16 +708,15 @@ class AsyncStealthySession(StealthySessionMixin, AsyncSession):
 
                 # Move the mouse to the center of the window, then press and hold the left mouse button
                 await page.mouse.click(turnstile_x, turnstile_y, delay=60, button="left")
-                await page.wait_for_load_state("networkidle")
                 if iframe is not None:
                     # Wait for the frame to be removed from the page
                     while iframe in page.frames:
                         await page.wait_for_timeout(100)
                 if challenge_type != "embedded":
-                    await page.locator(box_selector).wait_for(state="detached")
+                    await box_locator.wait_for(state="detached")
                     await page.locator(".zone-name-title").wait_for(state="hidden")
+                # The load event always comes after `domcontentloaded`, so there's no need to wait for both
                 await page.wait_for_load_state(state="load")
-                await page.wait_for_load_state(state="domcontentloaded")
 
                 log.info("Cloudflare turnstile is solved")
                 return
@@ -762,7 +746,7 @@ class AsyncStealthySession(StealthySessionMixin, AsyncSession):
         :param page_action: Added for automation. A function that takes the `page` object and does the automation you need.
         :param extra_headers: A dictionary of extra headers to add to the request. _The referer set by the `google_search` argument takes priority over the referer set here if used together._
         :param disable_resources: Drop requests of unnecessary resources for a speed boost. It depends, but it made requests ~25% faster in my tests for some websites.
-            Requests dropped are of type `font`, `image`, `media`, `beacon`, `object`, `imageset`, `texttrack`, `websocket`, `csp_report`, and `stylesheet`.
+            Requests dropped are of type `font`, `image`, `media`, `beacon`, `object`, `imageset`, `texttrack`, `websocket`, `csp_report`, `manifest`, and `stylesheet`.
             This can help save your proxy usage but be careful with this option as it makes some websites never finish loading.
         :param wait_selector: Wait for a specific CSS selector to be in a specific state.
         :param wait_selector_state: The state to wait for the selector given with `wait_selector`. The default state is `attached`.
@@ -819,11 +803,7 @@ class AsyncStealthySession(StealthySessionMixin, AsyncSession):
             # Navigate to URL and wait for a specified state
             page_info.page.on("response", handle_response)
             first_response = await page_info.page.goto(url, referer=referer)
-            if params.load_dom:
-                await page_info.page.wait_for_load_state(state="domcontentloaded")
-
-            if params.network_idle:
-                await page_info.page.wait_for_load_state("networkidle")
+            await self._wait_for_page_stability(page_info.page, params.load_dom, params.network_idle)
 
             if not first_response:
                 raise RuntimeError(f"Failed to get response for {url}")
@@ -831,11 +811,7 @@ class AsyncStealthySession(StealthySessionMixin, AsyncSession):
             if params.solve_cloudflare:
                 await self._solve_cloudflare(page_info.page)
                 # Make sure the page is fully loaded after the turnstile
-                await page_info.page.wait_for_load_state(state="load")
-                if params.load_dom:
-                    await page_info.page.wait_for_load_state(state="domcontentloaded")
-                if params.network_idle:
-                    await page_info.page.wait_for_load_state("networkidle")
+                await self._wait_for_page_stability(page_info.page, params.load_dom, params.network_idle)
 
             if params.page_action:
                 try:
@@ -848,11 +824,7 @@ class AsyncStealthySession(StealthySessionMixin, AsyncSession):
                     waiter: AsyncLocator = page_info.page.locator(params.wait_selector)
                     await waiter.first.wait_for(state=params.wait_selector_state)
                     # Wait again after waiting for the selector, helpful with protections like Cloudflare
-                    await page_info.page.wait_for_load_state(state="load")
-                    if params.load_dom:
-                        await page_info.page.wait_for_load_state(state="domcontentloaded")
-                    if params.network_idle:
-                        await page_info.page.wait_for_load_state("networkidle")
+                    await self._wait_for_page_stability(page_info.page, params.load_dom, params.network_idle)
                 except Exception as e:
                     log.error(f"Error waiting for selector {params.wait_selector}: {e}")
 
@@ -68,7 +68,10 @@ class PagePool:
         with self._lock:
             return sum(1 for p in self.pages if p.state == "busy")
 
-    def cleanup_error_pages(self):
-        """Remove pages in error state"""
+    def cleanup_error_pages(self) -> List[PageInfo]:
+        """Remove pages in error state and return them, so the caller can close them"""
         with self._lock:
-            self.pages = [p for p in self.pages if p.state != "error"]
+            error_pages = [p for p in self.pages if p.state == "error"]
+            if error_pages:
+                self.pages = [p for p in self.pages if p.state != "error"]
+            return error_pages
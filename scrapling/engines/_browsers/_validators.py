@@ -1,7 +1,7 @@
 from pathlib import Path
 from typing import Annotated
 from functools import lru_cache
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 from dataclasses import dataclass, fields
 
 from msgspec import Struct, Meta, convert, ValidationError
@@ -48,7 +48,7 @@ def _is_invalid_cdp_url(cdp_url: str) -> bool | str:
     if not cdp_url.startswith(("ws://", "wss://")):
         return "CDP URL must use 'ws://' or 'wss://' scheme"
 
-    netloc = urlparse(cdp_url).netloc
+    netloc = urlsplit(cdp_url).netloc
     if not netloc:
         return "Invalid hostname for the CDP URL"
     return False
@@ -175,7 +175,7 @@ class CamoufoxConfig(Struct, kw_only=True, frozen=False, weakref=True):
             self.additional_args = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class _fetch_params:
     """A dataclass of all parameters used by `fetch` calls"""
 
@@ -193,6 +193,10 @@ class _fetch_params:
     selector_config: Dict
 
 
+# Resolved once, `validate_fetch` runs on every fetch call
+_fetch_params_fields = tuple(f.name for f in fields(_fetch_params))
+
+
 def validate_fetch(
     params: List[Tuple], model: type[PlaywrightConfig] | type[CamoufoxConfig], sentinel=None
 ) -> _fetch_params:
@@ -209,9 +213,7 @@ def validate_fetch(
         validated_config = validate(overrides, model)
         # Extract only the fields that _fetch_params needs from validated_config
         validated_dict = {
-            f.name: getattr(validated_config, f.name)
-            for f in fields(_fetch_params)
-            if hasattr(validated_config, f.name)
+            name: getattr(validated_config, name) for name in _fetch_params_fields if hasattr(validated_config, name)
         }
         # solve_cloudflare defaults to False for models that don't have it (PlaywrightConfig)
         validated_dict.setdefault("solve_cloudflare", False)
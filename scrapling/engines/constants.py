@@ -9,6 +9,7 @@ DEFAULT_DISABLED_RESOURCES = {
     "texttrack",
     "websocket",
     "csp_report",
+    "manifest",
     "stylesheet",
 }
 
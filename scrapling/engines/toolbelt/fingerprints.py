@@ -3,6 +3,7 @@ Functions related to generating headers and fingerprints generally
 """
 
 from functools import lru_cache
+from urllib.parse import urlsplit
 from platform import system as platform_system
 
 from tldextract import extract
@@ -15,7 +16,13 @@ __OS_NAME__ = platform_system()
 OSName = Literal["linux", "macos", "windows"]
 
 
-@lru_cache(10, typed=True)
+@lru_cache(128, typed=True)
+def _google_search_referer(host: str) -> str:
+    """Build Google's search URL for the domain name of the given host, cached per host"""
+    website_name = extract(host).domain
+    return f"https://www.google.com/search?q={website_name}"
+
+
 def generate_convincing_referer(url: str) -> str:
     """Takes the domain from the URL without the subdomain/suffix and make it look like you were searching Google for this website
 
@@ -25,8 +32,8 @@ def generate_convincing_referer(url: str) -> str:
     :param url: The URL you are about to fetch.
     :return: Google's search URL of the domain name
     """
-    website_name = extract(url).domain
-    return f"https://www.google.com/search?q={website_name}"
+    # The referer only depends on the host, so every page of the same website shares one cache entry
+    return _google_search_referer(urlsplit(url).netloc or url)
 
 
 @lru_cache(1, typed=True)
@@ -46,11 +53,12 @@ def get_os_name() -> OSName | Tuple:
             return SUPPORTED_OPERATING_SYSTEMS
 
 
-def generate_headers(browser_mode: bool = False) -> Dict:
-    """Generate real browser-like headers using browserforge's generator
+@lru_cache(2, typed=True)
+def _get_header_generator(browser_mode: bool) -> HeaderGenerator:
+    """Build browserforge's header generator once per mode, loading its data is far costlier than generating headers
 
     :param browser_mode: If enabled, the headers created are used for playwright, so it has to match everything
-    :return: A dictionary of the generated headers
+    :return: A `HeaderGenerator` instance
     """
     # In the browser mode, we don't care about anything other than matching the OS and the browser type with the browser we are using,
     # So we don't raise any inconsistency red flags while websites fingerprinting us
@@ -64,7 +72,16 @@ def generate_headers(browser_mode: bool = False) -> Dict:
                 Browser(name="edge", min_version=130),
             ]
         )
-    return HeaderGenerator(browser=browsers, os=os_name, device="desktop").generate()
+    return HeaderGenerator(browser=browsers, os=os_name, device="desktop")
+
+
+def generate_headers(browser_mode: bool = False) -> Dict:
+    """Generate real browser-like headers using browserforge's generator
+
+    :param browser_mode: If enabled, the headers created are used for playwright, so it has to match everything
+    :return: A dictionary of the generated headers
+    """
+    return _get_header_generator(browser_mode).generate()
 
 
 __default_useragent__ = generate_headers(browser_mode=False).get("User-Agent")
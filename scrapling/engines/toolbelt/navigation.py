@@ -4,7 +4,7 @@ Functions related to files and URLs
 
 from pathlib import Path
 from functools import lru_cache
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from playwright.async_api import Route as async_Route
 from msgspec import Struct, structs, convert, ValidationError
@@ -29,8 +29,10 @@ def intercept_route(route: Route):
     :param route: PlayWright `Route` object of the current page
     :return: PlayWright `Route` object
     """
-    if route.request.resource_type in DEFAULT_DISABLED_RESOURCES:
-        log.debug(f'Blocking background resource "{route.request.url}" of type "{route.request.resource_type}"')
+    request = route.request
+    if request.resource_type in DEFAULT_DISABLED_RESOURCES:
+        # Lazy formatting, so the message is only built when debug logging is enabled
+        log.debug('Blocking background resource "%s" of type "%s"', request.url, request.resource_type)
         route.abort()
     else:
         route.continue_()
@@ -42,8 +44,10 @@ async def async_intercept_route(route: async_Route):
     :param route: PlayWright `Route` object of the current page
     :return: PlayWright `Route` object
     """
-    if route.request.resource_type in DEFAULT_DISABLED_RESOURCES:
-        log.debug(f'Blocking background resource "{route.request.url}" of type "{route.request.resource_type}"')
+    request = route.request
+    if request.resource_type in DEFAULT_DISABLED_RESOURCES:
+        # Lazy formatting, so the message is only built when debug logging is enabled
+        log.debug('Blocking background resource "%s" of type "%s"', request.url, request.resource_type)
         await route.abort()
     else:
         await route.continue_()
@@ -66,7 +70,7 @@ def construct_proxy_dict(proxy_string: str | Dict[str, str] | Tuple, as_tuple: b
     :return:
     """
     if isinstance(proxy_string, str):
-        proxy = urlparse(proxy_string)
+        proxy = urlsplit(proxy_string)
         if proxy.scheme not in ("http", "https", "socks4", "socks5") or not proxy.hostname:
             raise ValueError("Invalid proxy string!")
 
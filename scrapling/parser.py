@@ -1,4 +1,6 @@
 from pathlib import Path
+from threading import local
+from functools import lru_cache
 from inspect import signature
 from urllib.parse import urljoin
 from difflib import SequenceMatcher
@@ -58,6 +60,35 @@ _find_all_elements_with_spaces = XPath(
 )  # This selector gets all elements with text content
 
 
+__XPATH_CACHE_SIZE__ = 256
+# Compiled selectors are cached per thread, lxml serializes the calls on one `XPath` object, so sharing them across threads makes them queue
+_xpath_cache = local()
+
+
+def _compile_xpath(selector: str) -> XPath:
+    """Compile the XPath selector once per thread, so repeated queries with the same selector skip re-parsing it"""
+    cache = getattr(_xpath_cache, "selectors", None)
+    if cache is None:
+        cache = _xpath_cache.selectors = {}
+
+    compiled = cache.get(selector)
+    if compiled is None:
+        if len(cache) >= __XPATH_CACHE_SIZE__:
+            cache.clear()
+        compiled = cache[selector] = XPath(selector)
+    return compiled
+
+
+@lru_cache(maxsize=256)
+def _split_css_selector(selector: str) -> Tuple[Tuple[str, str], ...]:
+    """Split a combined CSS selector into `(canonical CSS, XPath)` pairs once, so repeated queries skip re-parsing it"""
+    pairs = []
+    for single_selector in split_selectors(selector):
+        canonical = single_selector.canonical()
+        pairs.append((canonical, _css_to_xpath(canonical)))
+    return tuple(pairs)
+
+
 class Selector(SelectorsGeneration):
     __slots__ = (
         "url",
@@ -308,7 +339,8 @@ class Selector(SelectorsGeneration):
                 text = node.text
                 if text and isinstance(text, str):
                     processed_text = text.strip() if strip else text
-                    if not valid_values or processed_text.strip():
+                    # `isspace` checks for whitespace-only text without allocating a stripped copy
+                    if not valid_values or (processed_text and not processed_text.isspace()):
                         _all_strings.append(processed_text)
 
         return cast(TextHandler, TextHandler(separator).join(_all_strings))
@@ -502,10 +534,14 @@ class Selector(SelectorsGeneration):
             if score_table[highest_probability] and highest_probability >= percentage:
                 if log.getEffectiveLevel() < 20:
                     # No need to execute this part if the logging level is not debugging
-                    log.debug(f"Highest probability was {highest_probability}%")
-                    log.debug("Top 5 best matching elements are: ")
-                    for percent in tuple(sorted(score_table.keys(), reverse=True))[:5]:
-                        log.debug(f"{percent} -> {self.__elements_convertor(score_table[percent])}")
+                    # One log record for the whole report instead of one per line
+                    top_matches = "\n".join(
+                        f"{percent} -> {self.__elements_convertor(score_table[percent])}"
+                        for percent in sorted(score_table.keys(), reverse=True)[:5]
+                    )
+                    log.debug(
+                        f"Highest probability was {highest_probability}%\nTop 5 best matching elements are:\n{top_matches}"
+                    )
 
                 if not selector_type:
                     return score_table[highest_probability]
@@ -624,13 +660,12 @@ class Selector(SelectorsGeneration):
                 )
 
             results = []
-            for single_selector in split_selectors(selector):
+            for canonical_selector, xpath_selector in _split_css_selector(selector):
                 # I'm doing this only so the `save` function saves data correctly for combined selectors
                 # Like using the ',' to combine two different selectors that point to different elements.
-                xpath_selector = _css_to_xpath(single_selector.canonical())
                 results += self.xpath(
                     xpath_selector,
-                    identifier or single_selector.canonical(),
+                    identifier or canonical_selector,
                     adaptive,
                     auto_save,
                     percentage,
@@ -676,7 +711,7 @@ class Selector(SelectorsGeneration):
             "_scrapling_first_match", False
         )  # Used internally only to speed up `css_first` and `xpath_first`
         try:
-            if elements := self._root.xpath(selector, **kwargs):
+            if elements := _compile_xpath(selector)(self._root, **kwargs):
                 if not self.__adaptive_enabled and auto_save:
                     log.warning(
                         "Argument `auto_save` will be ignored because `adaptive` wasn't enabled on initialization. Check docs for more info."
@@ -981,7 +1016,7 @@ class Selector(SelectorsGeneration):
         return self.text.re_first(regex, default, replace_entities, clean_match, case_sensitive)
 
     @staticmethod
-    def __get_attributes(element: HtmlElement, ignore_attributes: List | Tuple) -> Dict:
+    def __get_attributes(element: HtmlElement, ignore_attributes: frozenset) -> Dict:
         """Return attributes dictionary without the ignored list"""
         return {k: v for k, v in element.attrib.items() if k not in ignore_attributes}
 
@@ -990,7 +1025,7 @@ class Selector(SelectorsGeneration):
         original: HtmlElement,
         original_attributes: Dict,
         candidate: HtmlElement,
-        ignore_attributes: List | Tuple,
+        ignore_attributes: frozenset,
         similarity_threshold: float,
         match_text: bool = False,
     ) -> bool:
@@ -1059,6 +1094,8 @@ class Selector(SelectorsGeneration):
         similar_elements = list()
 
         current_depth = len(list(root.iterancestors()))
+        # A set once, since every attribute of every candidate is checked against it
+        ignore_attributes = frozenset(ignore_attributes)
         target_attrs = self.__get_attributes(root, ignore_attributes) if ignore_attributes else root.attrib
 
         path_parts = [self.tag]
@@ -241,3 +241,10 @@ class TestCLI:
             call_kwargs = mock_get.call_args[1]
             assert isinstance(call_kwargs['impersonate'], str)
             assert call_kwargs['impersonate'] == 'chrome'
+
+    def test_log_is_importable(self):
+        """Test that `log` can still be imported from the CLI module"""
+        from scrapling.cli import log
+        from scrapling.core.utils import log as core_log
+
+        assert log is core_log
@@ -1,7 +1,9 @@
 import pytest
+from unittest.mock import patch
 
+from curl_cffi.curl import CurlError
 
-from scrapling.engines.static import _SyncSessionLogic as FetcherSession, FetcherClient
+from scrapling.engines.static import _SyncSessionLogic as FetcherSession, FetcherClient, _backoff_delay
 
 
 class TestFetcherSession:
@@ -43,3 +45,49 @@ class TestFetcherSession:
         # Should not have context manager methods
         assert client.__enter__ is None
         assert client.__exit__ is None
+
+    def test_fetcher_client_retries_reuse_one_off_session(self):
+        """Test that retries reuse the same one-off session and close it only once"""
+        client = FetcherClient()
+
+        with patch("scrapling.engines.static.CurlSession") as session_class:
+            session = session_class.return_value
+            session.request.side_effect = CurlError("Connection failed")
+
+            with pytest.raises(CurlError):
+                client.get("https://example.com", retries=3, retry_delay=0)
+
+        assert session_class.call_count == 1
+        assert session.request.call_count == 3
+        session.close.assert_called_once()
+
+    def test_fetcher_client_retries_back_off_exponentially(self):
+        """Test that the wait between retries doubles after each failed attempt"""
+        client = FetcherClient()
+
+        with patch("scrapling.engines.static.CurlSession") as session_class, patch(
+            "scrapling.engines.static.time_sleep"
+        ) as sleep:
+            session_class.return_value.request.side_effect = CurlError("Connection failed")
+
+            with pytest.raises(CurlError):
+                client.get("https://example.com", retries=4, retry_delay=1)
+
+        delays = [call.args[0] for call in sleep.call_args_list]
+        assert len(delays) == 3
+        for attempt, delay in enumerate(delays):
+            assert 2**attempt <= delay <= 1.5 * 2**attempt
+
+    def test_backoff_delay_is_capped(self):
+        """Test that the exponential growth stops at the ceiling, plus at most half of it as jitter"""
+        for attempt in (6, 9, 20):
+            assert 60 <= _backoff_delay(1, attempt) <= 90
+
+    def test_backoff_delay_keeps_a_larger_base_delay(self):
+        """Test that a retry delay above the ceiling is never shortened"""
+        for attempt in (0, 1, 5):
+            assert 120 <= _backoff_delay(120, attempt) <= 180
+
+    def test_backoff_delay_without_base_delay(self):
+        """Test that a zero retry delay stays zero"""
+        assert _backoff_delay(0, 3) == 0
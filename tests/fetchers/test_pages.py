@@ -101,6 +101,7 @@ class TestPagePool:
 
         assert pool.pages_count == 3
 
-        pool.cleanup_error_pages()
+        removed = pool.cleanup_error_pages()
 
         assert pool.pages_count == 1  # Only 2 should remain
+        assert removed == [page1, page3]
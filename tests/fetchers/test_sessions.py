@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from scrapling.engines._browsers._base import SyncSession, AsyncSession
+
+
+class TestSessionPagePool:
+    """Test the page pool of a session with mocked pages"""
+
+    def test_fetch_after_failed_one_gets_a_page(self):
+        """Test a failed request doesn't keep its slot in the pool"""
+        session = SyncSession(max_pages=1)
+        session.context = Mock()
+        session.context.new_page = Mock(side_effect=lambda: Mock())
+
+        failed_page = session._get_page(30000, None, False)
+        failed_page.mark_error()  # What `fetch` does when the request fails
+
+        page_info = session._get_page(30000, None, False)
+
+        assert page_info.page is not failed_page.page
+        assert page_info.state == "busy"
+        assert session.page_pool.pages == [page_info]
+        failed_page.page.close.assert_called_once()
+        page_info.page.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestAsyncSessionPagePool:
+    """Test the page pool of an async session with mocked pages"""
+
+    @staticmethod
+    def _mocked_session() -> AsyncSession:
+        session = AsyncSession(max_pages=1)
+        session.context = Mock()
+        session.context.new_page = AsyncMock(side_effect=lambda: Mock(close=AsyncMock()))
+        return session
+
+    async def test_fetch_after_failed_one_gets_a_page(self):
+        """Test a failed request doesn't keep its slot in the pool"""
+        session = self._mocked_session()
+
+        failed_page = await session._get_page(30000, None, False)
+        failed_page.mark_error()  # What `fetch` does when the request fails
+
+        page_info = await session._get_page(30000, None, False)
+
+        assert page_info.page is not failed_page.page
+        assert session.page_pool.pages == [page_info]
+        failed_page.page.close.assert_awaited_once()
+        page_info.page.close.assert_not_awaited()
+
+    async def test_request_failing_while_waiting_frees_its_page(self):
+        """Test a request waiting for a full pool gets the page of a request that failed meanwhile"""
+        session = self._mocked_session()
+        session._max_wait_for_page = 2
+
+        busy_page = await session._get_page(30000, None, False)
+        busy_page.mark_busy()
+        # The running request fails after the next one started waiting for a free page
+        asyncio.get_running_loop().call_later(0.2, busy_page.mark_error)
+
+        page_info = await session._get_page(30000, None, False)
+
+        assert page_info.page is not busy_page.page
+        assert session.page_pool.pages == [page_info]
+        busy_page.page.close.assert_awaited_once()
+        page_info.page.close.assert_not_awaited()
@@ -247,6 +247,13 @@ class TestFingerprintFunctions:
 
         assert result1 == result2
 
+    def test_generate_convincing_referer_same_host(self):
+        """Test that different pages of the same website get the same referer"""
+        result1 = generate_convincing_referer("https://www.example.com/page1?q=1")
+        result2 = generate_convincing_referer("https://www.example.com/page2")
+
+        assert result1 == result2 == "https://www.google.com/search?q=example"
+
     def test_get_os_name(self):
         """Test OS name detection"""
         result = get_os_name()
@@ -1,11 +1,13 @@
 import pickle
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from cssselect import SelectorError, SelectorSyntaxError
 
 from scrapling import Selector
+from scrapling.parser import _compile_xpath
 logging.getLogger("scrapling").setLevel(logging.DEBUG)
 
 
@@ -115,6 +117,36 @@ class TestXPathSelectors:
         )
         assert len(high_priced_products) == 2
 
+    def test_xpath_variables_with_reused_selector(self, page):
+        """Test that the same selector gives per-call results when evaluated with different variables"""
+        selector = '//article[@data-id=$product_id]'
+        assert page.xpath(selector, product_id="1")[0].attrib["data-id"] == "1"
+        assert page.xpath(selector, product_id="3")[0].attrib["data-id"] == "3"
+        assert len(page.xpath(selector, product_id="4")) == 0
+
+    def test_reused_selector_across_threads(self):
+        """Test that threads running the same selector on different documents each get their own results"""
+        selector = '//article[@data-id=$product_id]/h3/text()'
+        documents = [
+            Selector(f'<html><body><article data-id="{i}"><h3>Product {i}</h3></article></body></html>')
+            for i in range(16)
+        ]
+
+        def run(i):
+            return [str(text) for _ in range(50) for text in documents[i].xpath(selector, product_id=str(i))]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(run, range(16)))
+
+        for i, texts in enumerate(results):
+            assert texts == [f"Product {i}"] * 50
+
+        # The compiled selector is reused within a thread, but never shared with another one
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_thread = executor.submit(_compile_xpath, selector).result()
+        assert _compile_xpath(selector) is _compile_xpath(selector)
+        assert _compile_xpath(selector) is not other_thread
+
 
 # Text Matching Tests
 class TestTextMatching: